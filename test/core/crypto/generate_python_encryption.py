@@ -1,13 +1,18 @@
-from nacl.public import PrivateKey, Box
-import base64
+from nacl.bindings import crypto_box_afternm, crypto_box_beforenm, crypto_box_NONCEBYTES
+from nacl.public import PrivateKey
 import json
+import os
+
+from interop_utils import b64
 
 # Generate keys
 alice_private = PrivateKey.generate()
 bob_private = PrivateKey.generate()
+alice_public = alice_private.public_key
+bob_public = bob_private.public_key
 
-# Create box (Alice encrypts to Bob)
-box = Box(alice_private, bob_private.public_key)
+# Precompute the shared key once (Alice encrypts to Bob)
+shared_key = crypto_box_beforenm(bytes(bob_public), bytes(alice_private))
 
 # Test messages
 messages = [
@@ -16,12 +21,19 @@ messages = [
     json.dumps({"from": "python", "to": "dart"})
 ]
 
+# Export keys once, outside the per-message loop
+alice_private_b64 = b64(bytes(alice_private))
+alice_public_b64 = b64(bytes(alice_public))
+bob_private_b64 = b64(bytes(bob_private))
+bob_public_b64 = b64(bytes(bob_public))
+
 for msg in messages:
-    ciphertext = box.encrypt(msg.encode('utf-8'))
+    nonce = os.urandom(crypto_box_NONCEBYTES)
+    ciphertext = nonce + crypto_box_afternm(msg.encode('utf-8'), nonce, shared_key)
     print(f"Message: {msg}")
-    print(f"Alice private: {base64.b64encode(bytes(alice_private)).decode()}")
-    print(f"Alice public: {base64.b64encode(bytes(alice_private.public_key)).decode()}")
-    print(f"Bob private: {base64.b64encode(bytes(bob_private)).decode()}")
-    print(f"Bob public: {base64.b64encode(bytes(bob_private.public_key)).decode()}")
-    print(f"Ciphertext: {base64.b64encode(ciphertext).decode()}")
+    print(f"Alice private: {alice_private_b64}")
+    print(f"Alice public: {alice_public_b64}")
+    print(f"Bob private: {bob_private_b64}")
+    print(f"Bob public: {bob_public_b64}")
+    print(f"Ciphertext: {b64(ciphertext)}")
     print()
@@ -0,0 +1,10 @@
+"""
+Shared helpers for the Dart↔Python NaCl interop scripts in this directory.
+"""
+
+from binascii import b2a_base64
+
+
+def b64(data):
+    """Base64-encode bytes to str without the base64 module's wrapper."""
+    return b2a_base64(data, newline=False).decode('ascii')
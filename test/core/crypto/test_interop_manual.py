@@ -3,30 +3,142 @@
 Manual test for Dart→Python interoperability.
 
 This script allows manual testing by accepting test vectors from Dart output.
+
+Usage:
+    python test_interop_manual.py --self-test
+    python test_interop_manual.py --alice-pub ... --bob-priv ... \\
+        --ciphertext ... --plaintext ...
+    python test_interop_manual.py --alice-pub ... --bob-priv ... \\
+        --vectors-file vectors.jsonl
+
+A vectors file holds one JSON object per line with "ciphertext" (Base64)
+and "plaintext" keys, all encrypted between the same pair of keys.
 """
 
+from nacl.exceptions import CryptoError
 from nacl.public import PrivateKey, PublicKey, Box
-import base64
+import argparse
+from binascii import a2b_base64
+import json
 import sys
 
-def test_known_vectors():
+from interop_utils import b64
+
+# Smallest valid ciphertext: 24-byte nonce + 16-byte Poly1305 MAC
+MIN_CIPHERTEXT_LENGTH = 24 + 16
+
+
+def parse_args(argv=None):
+    """Parse command-line options for the manual interop test."""
+    parser = argparse.ArgumentParser(
+        description="Verify PyNaCl can decrypt Dart-encrypted messages.",
+    )
+    parser.add_argument('--self-test', action='store_true',
+                        help="Run a quick Python-only self-test")
+    parser.add_argument('--alice-pub', help="Alice's public key (Base64)")
+    parser.add_argument('--bob-priv', help="Bob's private key (Base64)")
+    parser.add_argument('--ciphertext', help="Ciphertext from Dart (Base64)")
+    parser.add_argument('--plaintext', help="Expected plaintext")
+    parser.add_argument('--vectors-file',
+                        help="JSON Lines file of ciphertext/plaintext pairs sharing the keys above")
+
+    args = parser.parse_args(argv)
+    if args.vectors_file is not None:
+        conflicting = [
+            flag for flag, value in [('--ciphertext', args.ciphertext), ('--plaintext', args.plaintext)]
+            if value is not None
+        ]
+        if conflicting:
+            parser.error(f"{', '.join(conflicting)} cannot be combined with --vectors-file")
+    if not args.self_test:
+        required = [('--alice-pub', args.alice_pub), ('--bob-priv', args.bob_priv)]
+        if args.vectors_file is None:
+            required += [('--ciphertext', args.ciphertext), ('--plaintext', args.plaintext)]
+        missing = [flag for flag, value in required if value is None]
+        if missing:
+            parser.error(f"missing {', '.join(missing)} (or pass --self-test)")
+    return args
+
+
+def load_vectors(path):
+    """
+    Read ciphertext/plaintext pairs from a JSON Lines file.
+
+    Returns a list of (line number, vector, error) tuples for the non-blank
+    lines; vector is None and error describes the problem for lines that
+    cannot be parsed.
+    """
+    vectors = []
+    with open(path, encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                vector = json.loads(line)
+            except json.JSONDecodeError as e:
+                vectors.append((lineno, None, f"invalid JSON: {e}"))
+                continue
+            if not (isinstance(vector, dict)
+                    and isinstance(vector.get('ciphertext'), str)
+                    and isinstance(vector.get('plaintext'), str)):
+                vectors.append((lineno, None, 'expected an object with string "ciphertext" and "plaintext"'))
+                continue
+            vectors.append((lineno, vector, None))
+    return vectors
+
+
+def verify_vectors(box, vectors):
+    """Decrypt every vector with one shared Box and report failures."""
+    if not vectors:
+        print("\nERROR: vectors file contains no vectors")
+        return False
+
+    failures = 0
+    for lineno, vector, error in vectors:
+        if error is not None:
+            print(f"FAILURE: line {lineno}: {error}")
+            failures += 1
+            continue
+        try:
+            ciphertext_bytes = a2b_base64(vector['ciphertext'])
+        except ValueError as e:
+            print(f"FAILURE: line {lineno}: invalid Base64 ciphertext: {e}")
+            failures += 1
+            continue
+        if len(ciphertext_bytes) < MIN_CIPHERTEXT_LENGTH:
+            print(f"FAILURE: line {lineno}: ciphertext is too short: "
+                  f"{len(ciphertext_bytes)} bytes, expected at least {MIN_CIPHERTEXT_LENGTH}")
+            failures += 1
+            continue
+        try:
+            decrypted = box.decrypt(ciphertext_bytes)
+        except CryptoError as e:
+            print(f"FAILURE: line {lineno}: failed to decrypt: {e}")
+            failures += 1
+            continue
+        if decrypted != vector['plaintext'].encode('utf-8'):
+            print(f"FAILURE: line {lineno}: plaintext mismatch")
+            failures += 1
+
+    print(f"\n{len(vectors) - failures}/{len(vectors)} vectors decrypted correctly")
+    if failures:
+        return False
+    print("\nSUCCESS: Dart→Python interop VERIFIED!")
+    return True
+
+
+def test_known_vectors(args):
     """
-    Test with hardcoded vectors if available, or prompt for manual input.
+    Run the Python self-test, or decrypt Dart vectors given on the command line.
     """
     print("=== Dart→Python Interop Manual Test ===\n")
     print("This script will verify PyNaCl can decrypt Dart-encrypted messages.")
     print("\nTo generate test vectors:")
     print("1. Run: dart run test/core/crypto/run_interop_test.dart")
     print("2. Copy the output from 'COPY-PASTE FOR PYTHON' section")
-    print("3. Paste below or hardcode into this script\n")
+    print("3. Pass the values to this script (see --help)\n")
 
-    # Example test - you would replace these with actual values from Dart
-    # For now, let's demonstrate the format
-
-    # Ask user if they want to test with manual input
-    mode = input("Choose mode:\n1. Manual input (paste from Dart output)\n2. Quick self-test (Python-only)\n\nEnter choice (1 or 2): ").strip()
-
-    if mode == "2":
+    if args.self_test:
         # Python self-test
         print("\n=== Python Self-Test ===")
         alice_private = PrivateKey.generate()
@@ -35,17 +147,17 @@ def test_known_vectors():
         alice_public = alice_private.public_key
         bob_public = bob_private.public_key
 
-        print(f"Alice Private: {base64.b64encode(bytes(alice_private)).decode()}")
-        print(f"Alice Public: {base64.b64encode(bytes(alice_public)).decode()}")
-        print(f"Bob Private: {base64.b64encode(bytes(bob_private)).decode()}")
-        print(f"Bob Public: {base64.b64encode(bytes(bob_public)).decode()}")
+        print(f"Alice Private: {b64(bytes(alice_private))}")
+        print(f"Alice Public: {b64(bytes(alice_public))}")
+        print(f"Bob Private: {b64(bytes(bob_private))}")
+        print(f"Bob Public: {b64(bytes(bob_public))}")
         print()
 
         # Alice encrypts to Bob
         box_alice = Box(alice_private, bob_public)
         message = "Hello, World!"
         encrypted = box_alice.encrypt(message.encode('utf-8'))
-        ciphertext_b64 = base64.b64encode(encrypted).decode()
+        ciphertext_b64 = b64(encrypted)
 
         print(f"Message: {message}")
         print(f"Ciphertext (Base64): {ciphertext_b64}")
@@ -61,53 +173,45 @@ def test_known_vectors():
         print(f"Match: {decrypted_text == message}")
         print("\nPython self-test PASSED - PyNaCl is working correctly")
         print("\nNow test with Dart by running: dart run test/core/crypto/run_interop_test.dart")
+        return True
 
-    elif mode == "1":
-        print("\nPaste Alice's private key (Base64):")
-        alice_private_b64 = input().strip()
-        print("Paste Alice's public key (Base64):")
-        alice_public_b64 = input().strip()
-        print("Paste Bob's private key (Base64):")
-        bob_private_b64 = input().strip()
-        print("Paste Bob's public key (Base64):")
-        bob_public_b64 = input().strip()
-        print("Paste ciphertext (Base64):")
-        ciphertext_b64 = input().strip()
-        print("Paste expected plaintext:")
-        expected_plaintext = input().strip()
-
-        # Verify
-        try:
-            alice_private = PrivateKey(base64.b64decode(alice_private_b64))
-            alice_public = PublicKey(base64.b64decode(alice_public_b64))
-            bob_private = PrivateKey(base64.b64decode(bob_private_b64))
-            bob_public = PublicKey(base64.b64decode(bob_public_b64))
+    # Verify
+    try:
+        # Only Bob's private key and Alice's public key are needed to decrypt
+        alice_public_bytes, bob_private_bytes = map(
+            a2b_base64, [args.alice_pub, args.bob_priv]
+        )
 
-            # Bob decrypts message from Alice
-            box = Box(bob_private, alice_public)
-            ciphertext_bytes = base64.b64decode(ciphertext_b64)
+        # Bob decrypts messages from Alice; the Box (and its shared key)
+        # is built once and reused for every vector
+        box = Box(PrivateKey(bob_private_bytes), PublicKey(alice_public_bytes))
 
-            print(f"\nCiphertext length: {len(ciphertext_bytes)} bytes")
-            print(f"Nonce (24 bytes): {base64.b64encode(ciphertext_bytes[:24]).decode()}")
-            print(f"Ciphertext+MAC: {len(ciphertext_bytes) - 24} bytes")
+        if args.vectors_file is not None:
+            return verify_vectors(box, load_vectors(args.vectors_file))
 
-            decrypted = box.decrypt(ciphertext_bytes)
-            decrypted_text = decrypted.decode('utf-8')
+        ciphertext_bytes = a2b_base64(args.ciphertext)
+
+        print(f"\nCiphertext length: {len(ciphertext_bytes)} bytes")
+        print(f"Nonce (24 bytes): {b64(ciphertext_bytes[:24])}")
+        print(f"Ciphertext+MAC: {len(ciphertext_bytes) - 24} bytes")
+
+        decrypted = box.decrypt(ciphertext_bytes)
+        decrypted_text = decrypted.decode('utf-8')
+
+        print(f"\nDecrypted: {decrypted_text}")
+        print(f"Expected: {args.plaintext}")
 
-            print(f"\nDecrypted: {decrypted_text}")
-            print(f"Expected: {expected_plaintext}")
+        if decrypted_text == args.plaintext:
+            print("\nSUCCESS: Dart→Python interop VERIFIED!")
+            return True
+        print("\nFAILURE: Plaintext mismatch!")
 
-            if decrypted_text == expected_plaintext:
-                print("\nSUCCESS: Dart→Python interop VERIFIED!")
-            else:
-                print("\nFAILURE: Plaintext mismatch!")
+    except Exception as e:
+        print(f"\nERROR: {e}")
+        import traceback
+        traceback.print_exc()
+    return False
 
-        except Exception as e:
-            print(f"\nERROR: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("Invalid choice")
 
 if __name__ == "__main__":
-    test_known_vectors()
+    sys.exit(0 if test_known_vectors(parse_args()) else 1)
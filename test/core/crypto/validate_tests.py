@@ -5,39 +5,45 @@ This script validates that all required test cases are present and properly stru
 """
 
 import re
+import sys
 from pathlib import Path
 
-def validate_test_file():
-    """Validate the key_pair_test.dart file."""
-    test_file = Path(__file__).parent / 'key_pair_test.dart'
-
-    if not test_file.exists():
-        print("ERROR: Test file not found!")
-        return False
-
-    content = test_file.read_text()
-
-    # Required test cases from the specification
-    required_tests = {
-        1: ("Generate new KeyPair", r"test\(['\"].*generate.*creates.*new.*KeyPair"),
-        2: ("Verify private key is 32 bytes", r"test\(['\"].*private.*key.*exactly.*32.*bytes"),
-        3: ("Verify public key is 32 bytes", r"test\(['\"].*public.*key.*exactly.*32.*bytes"),
-        4: ("Test toBase64() produces valid Base64", r"test\(['\"].*toBase64.*produces.*valid.*Base64"),
-        5: ("Test fromBase64() reconstructs keys", r"test\(['\"].*fromBase64.*reconstructs.*original.*keys"),
-        6: ("Verify public key derives consistently", r"test\(['\"].*public.*key.*derives.*from.*private.*key.*consistently"),
-        7: ("Test round-trip", r"test\(['\"].*round-trip.*generate.*to.*Base64.*and.*back"),
-        8: ("Edge case: Invalid Base64", r"test\(['\"].*fromBase64.*throws.*FormatException.*for.*invalid.*Base64"),
-        9: ("Edge case: Wrong length keys", r"test\(['\"].*fromBase64.*throws.*ArgumentError.*for.*wrong.*length"),
-    }
-
-    print("=" * 80)
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+# Required test cases from the specification
+_REQUIRED_TEST_PATTERNS = {
+    1: ("Generate new KeyPair", rb"test\(['\"].*generate.*creates.*new.*KeyPair"),
+    2: ("Verify private key is 32 bytes", rb"test\(['\"].*private.*key.*exactly.*32.*bytes"),
+    3: ("Verify public key is 32 bytes", rb"test\(['\"].*public.*key.*exactly.*32.*bytes"),
+    4: ("Test toBase64() produces valid Base64", rb"test\(['\"].*toBase64.*produces.*valid.*Base64"),
+    5: ("Test fromBase64() reconstructs keys", rb"test\(['\"].*fromBase64.*reconstructs.*original.*keys"),
+    6: ("Verify public key derives consistently", rb"test\(['\"].*public.*key.*derives.*from.*private.*key.*consistently"),
+    7: ("Test round-trip", rb"test\(['\"].*round-trip.*generate.*to.*Base64.*and.*back"),
+    8: ("Edge case: Invalid Base64", rb"test\(['\"].*fromBase64.*throws.*FormatException.*for.*invalid.*Base64"),
+    9: ("Edge case: Wrong length keys", rb"test\(['\"].*fromBase64.*throws.*ArgumentError.*for.*wrong.*length"),
+}
+
+# Patterns are compiled once at import rather than on every search
+REQUIRED_TESTS = [
+    (test_num, description, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+    for test_num, (description, pattern) in _REQUIRED_TEST_PATTERNS.items()
+]
+TEST_NAME_RE = re.compile(rb"test\(['\"]([^'\"]+)['\"]")
+GROUP_RE = re.compile(rb"group\(['\"]KeyPair['\"]")
+
+TEST_FILE = Path(__file__).parent / 'key_pair_test.dart'
+
+
+def validate_test_file(content):
+    """Validate the contents (bytes) of the key_pair_test.dart file."""
+    print(SEP80)
     print("KeyPair Test Validation Report")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     # Count total tests
-    test_pattern = re.compile(r"test\(['\"]([^'\"]+)['\"]")
-    all_tests = test_pattern.findall(content)
+    all_tests = TEST_NAME_RE.findall(content)
 
     print(f"Total tests found: {len(all_tests)}")
     print()
@@ -46,8 +52,8 @@ def validate_test_file():
     found_count = 0
     missing_tests = []
 
-    for test_num, (description, pattern) in required_tests.items():
-        if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
+    for test_num, description, pattern in REQUIRED_TESTS:
+        if pattern.search(content):
             print(f"✓ Test Case {test_num}: {description} - FOUND")
             found_count += 1
         else:
@@ -55,10 +61,10 @@ def validate_test_file():
             missing_tests.append(test_num)
 
     print()
-    print("=" * 80)
+    print(SEP80)
     print("Validation Summary")
-    print("=" * 80)
-    print(f"Required test cases: {len(required_tests)}")
+    print(SEP80)
+    print(f"Required test cases: {len(REQUIRED_TESTS)}")
     print(f"Found test cases: {found_count}")
     print(f"Missing test cases: {len(missing_tests)}")
 
@@ -69,80 +75,86 @@ def validate_test_file():
 
     # Additional validation checks
     print("Additional Validation Checks:")
-    print("-" * 80)
+    print(DASH80)
 
     # Check for proper imports
-    if "import 'package:flutter_test/flutter_test.dart'" in content:
+    if b"import 'package:flutter_test/flutter_test.dart'" in content:
         print("✓ flutter_test package imported")
     else:
         print("✗ flutter_test package NOT imported")
 
-    if "import 'package:myagents_frontend/core/crypto/key_pair.dart'" in content:
+    if b"import 'package:myagents_frontend/core/crypto/key_pair.dart'" in content:
         print("✓ KeyPair class imported")
     else:
         print("✗ KeyPair class NOT imported")
 
     # Check for group
-    if re.search(r"group\(['\"]KeyPair['\"]", content):
+    if GROUP_RE.search(content):
         print("✓ Test group defined")
     else:
         print("✗ Test group NOT defined")
 
     # Check for key assertions
     assertions_to_check = [
-        ("privateKeyBytes.length", "Private key length check"),
-        ("publicKeyBytes.length", "Public key length check"),
-        ("toBase64()", "toBase64 method call"),
-        ("fromBase64", "fromBase64 method call"),
-        ("throwsFormatException", "FormatException check"),
-        ("throwsArgumentError", "ArgumentError check"),
+        (b"privateKeyBytes.length", "Private key length check"),
+        (b"publicKeyBytes.length", "Public key length check"),
+        (b"toBase64()", "toBase64 method call"),
+        (b"fromBase64", "fromBase64 method call"),
+        (b"throwsFormatException", "FormatException check"),
+        (b"throwsArgumentError", "ArgumentError check"),
     ]
 
+    found_assertions = {a for a, _ in assertions_to_check if a in content}
+
     print()
     print("Key Assertions Present:")
-    print("-" * 80)
+    print(DASH80)
     for assertion, description in assertions_to_check:
-        if assertion in content:
-            print(f"✓ {description}: {assertion}")
+        if assertion in found_assertions:
+            print(f"✓ {description}: {assertion.decode()}")
         else:
-            print(f"✗ {description}: {assertion}")
+            print(f"✗ {description}: {assertion.decode()}")
 
     print()
-    print("=" * 80)
+    print(SEP80)
 
-    if found_count == len(required_tests):
+    if found_count == len(REQUIRED_TESTS):
         print("SUCCESS: All required test cases are present!")
-        print("=" * 80)
+        print(SEP80)
         return True
     else:
-        print(f"INCOMPLETE: {len(required_tests) - found_count} test case(s) missing")
-        print("=" * 80)
+        print(f"INCOMPLETE: {len(REQUIRED_TESTS) - found_count} test case(s) missing")
+        print(SEP80)
         return False
 
-def list_all_tests():
+def list_all_tests(content):
     """List all tests in detail."""
-    test_file = Path(__file__).parent / 'key_pair_test.dart'
-    content = test_file.read_text()
-
     print()
-    print("=" * 80)
+    print(SEP80)
     print("Detailed Test List")
-    print("=" * 80)
+    print(SEP80)
     print()
 
-    test_pattern = re.compile(r"test\(['\"]([^'\"]+)['\"]")
-    tests = test_pattern.findall(content)
+    tests = TEST_NAME_RE.findall(content)
 
     for i, test_name in enumerate(tests, 1):
-        print(f"{i:2}. {test_name}")
+        print(f"{i:2}. {test_name.decode('utf-8')}")
 
     print()
-    print("=" * 80)
+    print(SEP80)
 
 if __name__ == "__main__":
+    if not TEST_FILE.exists():
+        print("ERROR: Test file not found!")
+        sys.exit(1)
+
+    # Read once and share the content between both passes. Everything
+    # is matched as bytes, so the file is never decoded as a whole.
+    content = TEST_FILE.read_bytes()
+
     print()
-    success = validate_test_file()
-    list_all_tests()
+    success = validate_test_file(content)
+    list_all_tests(content)
 
     print()
     print("NOTE: The Flutter/Dart test runner is not available in this environment.")
@@ -11,10 +11,19 @@ Usage:
 3. Run this script to verify Python can decrypt Dart-encrypted messages
 """
 
+from nacl.exceptions import CryptoError
 from nacl.public import PrivateKey, PublicKey, Box
-import base64
+from binascii import a2b_base64
 import sys
 
+SEP50 = "=" * 50
+
+# Set to True to print the nonce / ciphertext+MAC split for each test case
+DEBUG = False
+
+# Smallest valid ciphertext: 24-byte nonce + 16-byte Poly1305 MAC
+MIN_CIPHERTEXT_LENGTH = 24 + 16
+
 def verify_decryption(alice_private_b64, alice_public_b64, bob_private_b64, bob_public_b64, test_cases):
     """
     Verify that Python can decrypt Dart-encrypted messages.
@@ -32,15 +41,15 @@ def verify_decryption(alice_private_b64, alice_public_b64, bob_private_b64, bob_
     print("=== PyNaCl Verification of Dart Encryption ===\n")
 
     # Import Alice's keys
-    alice_private_bytes = base64.b64decode(alice_private_b64)
-    alice_public_bytes = base64.b64decode(alice_public_b64)
+    alice_private_bytes = a2b_base64(alice_private_b64)
+    alice_public_bytes = a2b_base64(alice_public_b64)
 
     print(f"Alice Private Key length: {len(alice_private_bytes)} bytes")
     print(f"Alice Public Key length: {len(alice_public_bytes)} bytes")
 
     # Import Bob's keys
-    bob_private_bytes = base64.b64decode(bob_private_b64)
-    bob_public_bytes = base64.b64decode(bob_public_b64)
+    bob_private_bytes = a2b_base64(bob_private_b64)
+    bob_public_bytes = a2b_base64(bob_public_b64)
 
     print(f"Bob Private Key length: {len(bob_private_bytes)} bytes")
     print(f"Bob Public Key length: {len(bob_public_bytes)} bytes")
@@ -70,21 +79,35 @@ def verify_decryption(alice_private_b64, alice_public_b64, bob_private_b64, bob_
     # Bob's private key + Alice's public key
     box = Box(bob_private, alice_public)
 
-    # Test each case
-    all_passed = True
+    # Pre-validation pass: decode every ciphertext and check its shape
+    # before any decryption, so bad input is reported up front
+    failures = []
+    decoded = []
     for i, test_case in enumerate(test_cases):
+        try:
+            ciphertext_bytes = a2b_base64(test_case['ciphertext'])
+        except ValueError as e:
+            # binascii.Error (bad padding/characters) is a ValueError
+            # subclass; non-ASCII input raises a plain ValueError
+            failures.append((i, test_case['name'], f"invalid Base64: {e}"))
+            continue
+        if len(ciphertext_bytes) < MIN_CIPHERTEXT_LENGTH:
+            failures.append((i, test_case['name'],
+                             f"ciphertext is {len(ciphertext_bytes)} bytes, "
+                             f"expected at least {MIN_CIPHERTEXT_LENGTH}"))
+            continue
+        decoded.append((i, test_case, ciphertext_bytes))
+
+    # Decrypt the well-formed cases in one tight loop
+    for i, test_case, ciphertext_bytes in decoded:
         name = test_case['name']
         expected_plaintext = test_case['plaintext']
-        ciphertext_b64 = test_case['ciphertext']
 
         print(f"Test Case {i+1}: {name}")
         print(f"Expected plaintext: {expected_plaintext}")
+        print(f"Ciphertext length: {len(ciphertext_bytes)} bytes")
 
-        try:
-            # Decode ciphertext from Base64
-            ciphertext_bytes = base64.b64decode(ciphertext_b64)
-            print(f"Ciphertext length: {len(ciphertext_bytes)} bytes")
-
+        if DEBUG:
             # Parse format: nonce (24 bytes) || ciphertext+MAC
             nonce = ciphertext_bytes[:24]
             ciphertext_with_mac = ciphertext_bytes[24:]
@@ -92,35 +115,39 @@ def verify_decryption(alice_private_b64, alice_public_b64, bob_private_b64, bob_
             print(f"Nonce length: {len(nonce)} bytes")
             print(f"Ciphertext+MAC length: {len(ciphertext_with_mac)} bytes")
 
-            # Decrypt using PyNaCl
-            # PyNaCl expects the full encrypted message (nonce prepended to ciphertext)
+        # Decrypt using PyNaCl
+        # PyNaCl expects the full encrypted message (nonce prepended to ciphertext)
+        try:
             decrypted = box.decrypt(ciphertext_bytes)
-            decrypted_text = decrypted.decode('utf-8')
-
-            print(f"Decrypted plaintext: {decrypted_text}")
-
-            # Verify match
-            if decrypted_text == expected_plaintext:
-                print("PASS: Plaintext matches!")
-            else:
-                print(f"FAIL: Plaintext mismatch!")
-                print(f"  Expected: {expected_plaintext}")
-                print(f"  Got: {decrypted_text}")
-                all_passed = False
-
-        except Exception as e:
+        except CryptoError as e:
             print(f"FAIL: Decryption failed with error: {e}")
-            all_passed = False
+            print("Hex dump (first 48 bytes):")
+            print(' '.join(f'{b:02x}' for b in ciphertext_bytes[:48]))
+            print()
+            failures.append((i, name, f"decryption failed: {e}"))
+            continue
+
+        decrypted_text = decrypted.decode('utf-8', errors='replace')
+        print(f"Decrypted plaintext: {decrypted_text}")
+
+        # Verify match
+        if decrypted == expected_plaintext.encode('utf-8'):
+            print("PASS: Plaintext matches!")
+        else:
+            print(f"FAIL: Plaintext mismatch!")
+            print(f"  Expected: {expected_plaintext}")
+            print(f"  Got: {decrypted_text}")
+            failures.append((i, name, "plaintext mismatch"))
 
-            # Hex dump for debugging
-            if 'ciphertext_bytes' in locals():
-                print("Hex dump (first 48 bytes):")
-                hex_dump = ' '.join(f'{b:02x}' for b in ciphertext_bytes[:48])
-                print(hex_dump)
+        print()
 
+    if failures:
+        print("Failures:")
+        for i, name, reason in sorted(failures):
+            print(f"  Test Case {i+1} ({name}): {reason}")
         print()
 
-    return all_passed
+    return not failures
 
 
 def main():
@@ -162,7 +189,7 @@ def main():
         test_cases
     )
 
-    print("=" * 50)
+    print(SEP50)
     if success:
         print("ALL TESTS PASSED - Dart→Python interop verified!")
         sys.exit(0)
@@ -9,81 +9,103 @@ This script tests the format compatibility by:
 """
 
 from nacl.public import PrivateKey, Box
-import base64
-
-# Use the same keys from our test
-alice_private_b64 = 'dL7U7Kx1/9tgFHziHd9jOY17Qk84aPQeqJnBKPg/mh0='
-bob_private_b64 = 't9s06qtsHQ6cOeaD7JFp3y5StaTij3npU6yM2SupOCI='
-
-alice_private = PrivateKey(base64.b64decode(alice_private_b64))
-bob_private = PrivateKey(base64.b64decode(bob_private_b64))
-
-# Alice encrypts to Bob
-box = Box(alice_private, bob_private.public_key)
-
-test_message = "Hello from Python!"
-plaintext_bytes = test_message.encode('utf-8')
-
-# Encrypt
-ciphertext = box.encrypt(plaintext_bytes)
-
-print("=== PyNaCl Box.encrypt() Format Analysis ===")
-print(f"Original message: {test_message}")
-print(f"Plaintext bytes: {len(plaintext_bytes)} bytes")
-print(f"Encrypted output: {len(ciphertext)} bytes")
-print(f"Base64 encoded: {base64.b64encode(ciphertext).decode()}")
-print()
-
-# PyNaCl's EncryptedMessage format
-print("=== Format Breakdown ===")
-print(f"Expected: nonce (24 bytes) + ciphertext (plaintext + 16-byte MAC)")
-print(f"Expected total: 24 + {len(plaintext_bytes)} + 16 = {24 + len(plaintext_bytes) + 16} bytes")
-print(f"Actual total: {len(ciphertext)} bytes")
-print()
-
-# Verify format
-nonce = ciphertext[:24]
-encrypted_data = ciphertext[24:]
-
-print("=== Split Analysis ===")
-print(f"Nonce (first 24 bytes): {len(nonce)} bytes")
-print(f"Nonce Base64: {base64.b64encode(bytes(nonce)).decode()}")
-print(f"Ciphertext+MAC (remaining): {len(encrypted_data)} bytes")
-print(f"  - Plaintext length: {len(plaintext_bytes)} bytes")
-print(f"  - MAC length: 16 bytes")
-print(f"  - Total: {len(plaintext_bytes) + 16} bytes")
-print(f"  - Matches actual: {len(encrypted_data) == len(plaintext_bytes) + 16}")
-print()
-
-# Test decryption with manual split
-print("=== Decryption Test (manual split) ===")
-try:
-    # Create box for decryption (Bob decrypts from Alice)
-    decrypt_box = Box(bob_private, alice_private.public_key)
-
-    # Decrypt the whole EncryptedMessage
-    decrypted = decrypt_box.decrypt(ciphertext)
-    decrypted_text = decrypted.decode('utf-8')
-
-    print(f"Decrypted successfully: {decrypted_text}")
-    print(f"Matches original: {decrypted_text == test_message}")
-except Exception as e:
-    print(f"ERROR: Decryption failed: {e}")
-
-print()
-print("=== Conclusion ===")
-if len(ciphertext) == 24 + len(plaintext_bytes) + 16:
-    print("✓ PyNaCl format is: nonce (24) || ciphertext (plaintext + 16-byte MAC)")
-    print("✓ This matches pinenacl's EncryptedMessage format")
-    print("✓ Dart's NaClCrypto.decrypt() should correctly split at byte 24")
-else:
-    print("✗ Format mismatch detected!")
-
-print()
-print("=== Test Vectors for Dart ===")
-print(f"Alice Private: {alice_private_b64}")
-print(f"Alice Public: {base64.b64encode(bytes(alice_private.public_key)).decode()}")
-print(f"Bob Private: {bob_private_b64}")
-print(f"Bob Public: {base64.b64encode(bytes(bob_private.public_key)).decode()}")
-print(f"Message: {test_message}")
-print(f"Ciphertext: {base64.b64encode(ciphertext).decode()}")
+from binascii import a2b_base64
+import sys
+
+from interop_utils import b64
+
+
+def main():
+    """Analyse Box.encrypt() output and print test vectors for Dart."""
+    # Use the same keys from our test
+    alice_private_b64 = 'dL7U7Kx1/9tgFHziHd9jOY17Qk84aPQeqJnBKPg/mh0='
+    bob_private_b64 = 't9s06qtsHQ6cOeaD7JFp3y5StaTij3npU6yM2SupOCI='
+
+    alice_private = PrivateKey(a2b_base64(alice_private_b64))
+    bob_private = PrivateKey(a2b_base64(bob_private_b64))
+
+    # Alice encrypts to Bob
+    box = Box(alice_private, bob_private.public_key)
+
+    test_message = "Hello from Python!"
+    plaintext_bytes = test_message.encode('utf-8')
+
+    # Encrypt
+    ciphertext = box.encrypt(plaintext_bytes)
+
+    sys.stdout.write("\n".join([
+        "=== PyNaCl Box.encrypt() Format Analysis ===",
+        f"Original message: {test_message}",
+        f"Plaintext bytes: {len(plaintext_bytes)} bytes",
+        f"Encrypted output: {len(ciphertext)} bytes",
+        f"Base64 encoded: {b64(ciphertext)}",
+        "",
+    ]) + "\n")
+
+    # PyNaCl's EncryptedMessage format
+    sys.stdout.write("\n".join([
+        "=== Format Breakdown ===",
+        f"Expected: nonce (24 bytes) + ciphertext (plaintext + 16-byte MAC)",
+        f"Expected total: 24 + {len(plaintext_bytes)} + 16 = {24 + len(plaintext_bytes) + 16} bytes",
+        f"Actual total: {len(ciphertext)} bytes",
+        "",
+    ]) + "\n")
+
+    # Verify format
+    nonce = ciphertext[:24]
+    encrypted_data = ciphertext[24:]
+
+    sys.stdout.write("\n".join([
+        "=== Split Analysis ===",
+        f"Nonce (first 24 bytes): {len(nonce)} bytes",
+        f"Nonce Base64: {b64(bytes(nonce))}",
+        f"Ciphertext+MAC (remaining): {len(encrypted_data)} bytes",
+        f"  - Plaintext length: {len(plaintext_bytes)} bytes",
+        f"  - MAC length: 16 bytes",
+        f"  - Total: {len(plaintext_bytes) + 16} bytes",
+        f"  - Matches actual: {len(encrypted_data) == len(plaintext_bytes) + 16}",
+        "",
+    ]) + "\n")
+
+    # Test decryption with manual split
+    print("=== Decryption Test (manual split) ===")
+    try:
+        # Create box for decryption (Bob decrypts from Alice)
+        decrypt_box = Box(bob_private, alice_private.public_key)
+
+        # Decrypt the whole EncryptedMessage
+        decrypted = decrypt_box.decrypt(ciphertext)
+        decrypted_text = decrypted.decode('utf-8')
+
+        sys.stdout.write("\n".join([
+            f"Decrypted successfully: {decrypted_text}",
+            f"Matches original: {decrypted_text == test_message}",
+        ]) + "\n")
+    except Exception as e:
+        print(f"ERROR: Decryption failed: {e}")
+
+    sys.stdout.write("\n=== Conclusion ===\n")
+    if len(ciphertext) == 24 + len(plaintext_bytes) + 16:
+        sys.stdout.write("\n".join([
+            "✓ PyNaCl format is: nonce (24) || ciphertext (plaintext + 16-byte MAC)",
+            "✓ This matches pinenacl's EncryptedMessage format",
+            "✓ Dart's NaClCrypto.decrypt() should correctly split at byte 24",
+        ]) + "\n")
+    else:
+        print("✗ Format mismatch detected!")
+
+    sys.stdout.write("\n".join([
+        "",
+        "=== Test Vectors for Dart ===",
+        f"Alice Private: {alice_private_b64}",
+        f"Alice Public: {b64(bytes(alice_private.public_key))}",
+        f"Bob Private: {bob_private_b64}",
+        f"Bob Public: {b64(bytes(bob_private.public_key))}",
+        f"Message: {test_message}",
+        f"Ciphertext: {b64(ciphertext)}",
+    ]) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
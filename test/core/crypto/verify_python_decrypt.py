@@ -14,9 +14,11 @@ from nacl.public import PrivateKey, Box, PublicKey
 import base64
 import json
 
-print("=" * 80)
+SEP80 = "=" * 80
+
+print(SEP80)
 print("PYTHON PYNACL → DART PINENACL INTEROPERABILITY VERIFICATION")
-print("=" * 80)
+print(SEP80)
 print()
 
 # Test vectors from our Dart test file
@@ -61,9 +63,9 @@ test_cases = [
 # Bob decrypts messages encrypted by Alice
 bob_box = Box(bob_private, alice_public)
 
-print("=" * 80)
+print(SEP80)
 print("DECRYPTION TESTS (Bob decrypts Alice's messages)")
-print("=" * 80)
+print(SEP80)
 print()
 
 all_passed = True
@@ -97,9 +99,9 @@ for i, test in enumerate(test_cases, 1):
 
     print()
 
-print("=" * 80)
+print(SEP80)
 print("FORMAT VERIFICATION")
-print("=" * 80)
+print(SEP80)
 print()
 
 # Verify format details for the first test case
@@ -126,9 +128,9 @@ print(f"  Actual: {len(ciphertext_bytes)} bytes")
 print(f"  Result: {'✓ PASS' if format_correct else '✗ FAIL'}")
 print()
 
-print("=" * 80)
+print(SEP80)
 print("REVERSE TEST (Alice encrypts fresh, Bob decrypts)")
-print("=" * 80)
+print(SEP80)
 print()
 
 # Alice encrypts a new message to Bob
@@ -154,9 +156,9 @@ except Exception as e:
 
 print()
 
-print("=" * 80)
+print(SEP80)
 print("FINAL SUMMARY")
-print("=" * 80)
+print(SEP80)
 print()
 
 if all_passed and format_correct and reverse_pass:
@@ -184,4 +186,4 @@ else:
         print("  - Reverse encryption test failed")
 
 print()
-print("=" * 80)
+print(SEP80)